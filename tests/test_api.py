@@ -1,87 +1,74 @@
 """Integration tests for ZKP Privacy Airdrop"""
 
-import os
 import pytest
 import requests
-from web3 import Web3
 
+from conftest import load_json
 
-@pytest.fixture
-def relayer_url():
-    return os.getenv("RELAYER_URL", "http://localhost:8080")
 
-
-def test_health_endpoint(relayer_url):
+def test_health_endpoint(relayer_url, relayer_up, cached_get):
     """Test that health endpoint returns correct response"""
     try:
-        response = requests.get(f"{relayer_url}/api/v1/health", timeout=5)
+        data = cached_get(f"{relayer_url}/api/v1/health")
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Network error: {e}")
-    assert response.status_code == 200
-    data = response.json()
     assert data["status"] in ["healthy", "unhealthy"]
     assert "version" in data
 
 
-def test_get_merkle_root(relayer_url):
+def test_get_merkle_root(relayer_url, relayer_up, cached_get):
     """Test getting Merkle root"""
     try:
-        response = requests.get(f"{relayer_url}/api/v1/merkle-root", timeout=5)
+        data = cached_get(f"{relayer_url}/api/v1/merkle-root")
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Network error: {e}")
-    assert response.status_code == 200
-
-    data = response.json()
     assert "merkle_root" in data
     assert data["merkle_root"].startswith("0x")
     assert len(data["merkle_root"]) == 66
 
 
-def test_get_contract_info(relayer_url):
+def test_get_contract_info(relayer_url, relayer_up, cached_get):
     """Test getting contract information"""
     try:
-        response = requests.get(f"{relayer_url}/api/v1/contract-info", timeout=5)
+        data = cached_get(f"{relayer_url}/api/v1/contract-info")
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Network error: {e}")
-    assert response.status_code == 200
-
-    data = response.json()
     assert data["network"] in ["optimism", "ethereum"]
     assert isinstance(data["chain_id"], int)
     assert "contracts" in data
 
 
-def test_get_stats(relayer_url):
+def test_get_stats(relayer_url, relayer_up, http):
     """Test getting relayer statistics"""
     try:
-        response = requests.get(f"{relayer_url}/api/v1/stats", timeout=5)
+        response = http.get(f"{relayer_url}/api/v1/stats", timeout=5)
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Network error: {e}")
     assert response.status_code == 200
 
-    data = response.json()
+    data = load_json(response)
     assert "total_claims" in data
     assert "successful_claims" in data
     assert "relayer_balance" in data
 
 
-def test_check_status_not_claimed(relayer_url):
+def test_check_status_not_claimed(relayer_url, relayer_up, http):
     """Test checking status for an unclaimed nullifier"""
     nullifier = "0x" + "0" * 64
     try:
-        response = requests.get(
+        response = http.get(
             f"{relayer_url}/api/v1/check-status/{nullifier}", timeout=5
         )
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Network error: {e}")
     assert response.status_code == 200
 
-    data = response.json()
+    data = load_json(response)
     assert data["claimed"] is False
     assert data["nullifier"] == nullifier
 
 
-def test_invalid_proof_submission(relayer_url):
+def test_invalid_proof_submission(relayer_url, relayer_up, http):
     """Test submitting an invalid proof"""
     payload = {
         "proof": {
@@ -96,7 +83,7 @@ def test_invalid_proof_submission(relayer_url):
     }
 
     try:
-        response = requests.post(
+        response = http.post(
             f"{relayer_url}/api/v1/submit-claim", json=payload, timeout=30
         )
     except requests.exceptions.RequestException as e:
@@ -3,27 +3,34 @@ from web3 import Web3
 import os
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def web3_provider():
-    """Web3 provider for testing"""
+    """Web3 provider shared across tests for connection reuse"""
     rpc_url = os.getenv("RPC_URL", "https://optimism.drpc.org")
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 10}))
     return w3
 
 
+@pytest.fixture(scope="session")
+def rpc_up(web3_provider):
+    """Probe the RPC once and skip dependent tests if it's unreachable"""
+    if not web3_provider.is_connected():
+        pytest.skip("RPC endpoint unreachable")
+
+
 def test_web3_connection(web3_provider):
     """Test that we can connect to the RPC"""
     assert web3_provider.is_connected()
 
 
-def test_get_block_number(web3_provider):
+def test_get_block_number(web3_provider, rpc_up):
     """Test getting block number"""
     block = web3_provider.eth.get_block("latest")
     assert block is not None
     assert block["number"] > 0
 
 
-def test_account_validation(web3_provider):
+def test_account_validation():
     """Test Ethereum address validation"""
     valid_address = "0x1234567890123456789012345678901234567890"
     invalid_address = "0x123"
@@ -32,9 +39,11 @@ def test_account_validation(web3_provider):
     assert Web3.is_address(invalid_address) is False
 
 
-def test_checksum_address(web3_provider):
+def test_checksum_address(checksum):
     """Test checksum address generation"""
     address = "0x1234567890123456789012345678901234567890"
-    checksum = Web3.to_checksum_address(address)
+    checksummed = checksum(address)
 
-    assert Web3.is_address(checksum) is True
+    assert Web3.is_address(checksummed) is True
+    # Repeat lookups are served from the memoized map
+    assert checksum(address) is checksummed